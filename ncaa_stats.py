@@ -13,9 +13,9 @@ Dependencies:
     - Libraries:
         - requests
         - pandas
-        - BeautifulSoup4
         - lxml
         - urllib3
+        - brotli (optional, lets the server send brotli-compressed pages)
 
 Usage Examples:
     - List all games by date:
@@ -37,68 +37,138 @@ Optional Arguments:
 
 import re
 import os
+import csv
 import json
 import time
 import argparse
-from typing import Optional, Any, Union
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Any, Union, Iterator, TextIO
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
 import requests
 from requests import Session, Response
 from requests.adapters import HTTPAdapter
 import pandas as pd
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-import lxml
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
+
+
+# XPath expressions are compiled once at import so that parsing only has to evaluate them.
+_XP_TABLES = etree.XPath("//table")
+_XP_BOX_SCORE_LINK = etree.XPath(
+    ".//a[starts-with(@target, 'box_score_')]"
+    "[contains(concat(' ', normalize-space(@class), ' '), ' skipMask ')]"
+)
+_XP_LIVE_BOX_SCORE_LINK = etree.XPath(
+    ".//a[@target='LIVE_BOX_SCORE']"
+    "[contains(concat(' ', normalize-space(@class), ' '), ' skipMask ')]"
+)
+_XP_MATCH_TIME = etree.XPath(".//div[@class='col-6 p-0']")
+_XP_PERIOD = etree.XPath(".//span[starts-with(@id, 'period_')]")
+_XP_CLOCK = etree.XPath(".//span[starts-with(@id, 'clock_')]")
+_XP_ATTENDANCE = etree.XPath(".//div[@class='col p-0 text-right']")
+_XP_LINESCORE = etree.XPath(".//table[starts-with(@id, 'linescore_')]")
+_XP_TDS = etree.XPath(".//td")
+_XP_CONTEST_ROWS = etree.XPath(".//tr[starts-with(@id, 'contest_')]")
+_XP_IMG = etree.XPath(".//img")
+_XP_TEAM_LINK = etree.XPath(
+    ".//a[contains(concat(' ', normalize-space(@class), ' '), ' skipMask ')]"
+)
+_XP_FINAL_SCORE = etree.XPath(".//div[starts-with(@id, 'score_')]")
+_XP_BOX_SCORE_TEAMS = etree.XPath("//div[@class='col p-2']")
+_XP_TEAM_NAME = etree.XPath(".//span[@class='d-none d-sm-block']")
+_XP_COMPETITOR_TABLE = etree.XPath(".//table[starts-with(@id, 'competitor_')]")
+_XP_THS = etree.XPath(".//th")
+_XP_TRS = etree.XPath(".//tr")
+_XP_CONFERENCE_OPTIONS = etree.XPath(
+    "//select[@id='conference_id_select']"
+    "[contains(concat(' ', normalize-space(@class), ' '), ' chosen-select ')][1]//option"
+)
+
+# The columns of the scoreboard, in output order.
+_SCOREBOARD_FIELDS = (
+    "game_id",
+    "match_time",
+    "match_period",
+    "match_clock",
+    "attendance",
+    *(
+        field
+        for venue in ("away", "home")
+        for field in (
+            f"{venue}_name",
+            f"{venue}_id",
+            f"{venue}_logo_url",
+            *(f"{venue}_period_{i+1}_score" for i in range(4)),
+            f"{venue}_final_score",
+        )
+    ),
+)
+
+# A single session is shared across every request so that urllib3's connection pool keeps the
+# TCP/TLS connection to stats.ncaa.org alive in between polls when running in --loop mode.
+# Only the encodings urllib3 can actually decode are advertised, so "br" is only sent when
+# brotli is installed.
+_SESSION = Session()
+_SESSION.headers.update(
+    {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 ( "
+            "KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
+        ),
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    }
+)
+_ADAPTER = HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 504),
+        allowed_methods=["HEAD", "GET", "OPTIONS"],
+    ),
+    pool_connections=4,
+    pool_maxsize=16,
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# The body and validators (ETag, Last-Modified) of previously fetched pages, keyed on the URL and
+# its query parameters, so that repeated polls can be answered with a 304 Not Modified. Only the
+# most recently used pages are kept so that walking many dates or games doesn't grow it unbounded.
+_RESPONSE_CACHE_MAX_ENTRIES = 32
+_RESPONSE_CACHE: OrderedDict[tuple, tuple[Optional[str], Optional[str], str]] = OrderedDict()
+# How fetches through _RESPONSE_CACHE were answered: "hits" reused a cached body after a
+# 304 Not Modified, "misses" downloaded the full body.
+_CACHE_STATS = {"hits": 0, "misses": 0}
 
 
 def _fetch_url(
     url: str,
-    retries: int = 3,
-    backoff_factor: float = 0.3,
-    status_forcelist: tuple = (500, 502, 504),
     timeout: int = 30,
     params: Optional[dict[Any, Any]] = None,
+    headers: Optional[dict[str, str]] = None,
 ) -> Response:
     """
-    Fetches a URL using requests with retries and exception handling.
+    Fetches a URL using the shared, pooled session with retries and exception handling.
 
     Args:
-        url                (str): The URL to fetch.
-        retries            (int): The number of retry attempts (default is 3).
-        backoff_factor   (float): A backoff factor to apply between attempts (default is 0.3).
-        status_forcelist (tuple): A set of HTTP status codes to retry (default is (500, 502, 504)).
-        timeout            (int): The timeout in seconds for the request (default is 5).
+        url       (str): The URL to fetch.
+        timeout   (int): The timeout in seconds for the request (default is 30).
+        params   (dict): Query string parameters to send with the request (default is None).
+        headers  (dict): Extra headers to send along with the session's defaults (default is None).
 
     Returns:
         Response object if the request is successful.
         None if all retries fail or an exception occurs.
     """
     try:
-        session = Session()
-        retries = Retry(
-            total=retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=status_forcelist,
-            allowed_methods=["HEAD", "GET", "OPTIONS"],
-        )
-        adapter = HTTPAdapter(max_retries=retries)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        response = session.get(
-            url,
-            params=params,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 ( "
-                    "KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
-                ),
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-            },
-            timeout=timeout,
-        )
+        response = _SESSION.get(url, params=params, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response
     except requests.exceptions.RequestException as e:
@@ -106,40 +176,88 @@ def _fetch_url(
         return None
 
 
-def _normalize_player_stats(player_data: dict[str, Any]) -> dict[str, Any]:
+def _fetch_text(url: str, params: Optional[dict[Any, Any]] = None) -> str | None:
     """
-    Normalizes player statistics by converting numeric strings to integers,
-    replacing empty strings with zeros, and substituting '*' with 1.
+    Fetches the body of a URL, revalidating any previously fetched copy with a conditional request.
 
     Args:
-        player_data (dict[Any, Any]): A dictionary containing player statistics.
+        url     (str): The URL to fetch.
+        params (dict): Query string parameters to send with the request (default is None).
 
     Returns:
-        dict[Any, Any]: A new dictionary with normalized values.
+        str: The body of the response, or the cached body if the server answered 304 Not Modified.
+        None if the request failed.
     """
-    normalized = {}
-    for key, value in player_data.items():
-        if isinstance(value, str):
-            if value.isdigit():
-                normalized[key] = int(value)
-            # Replace empty strings with zero
-            elif value == "":
-                normalized[key] = 0
-            # Replace '*' with 1
-            elif value == "*":
-                normalized[key] = 1
-            # Keep other strings as-is
-            else:
-                normalized[key] = value
-        else:
-            # Preserve non-string values as-is
-            normalized[key] = value
-    return normalized
+    cache_key = (url, tuple(sorted((params or {}).items())))
+    cached = _RESPONSE_CACHE.get(cache_key)
+    headers = {}
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    response = _fetch_url(url, params=params, headers=headers)
+    if response is None:
+        return None
+    if response.status_code == 304 and cached is not None:
+        _CACHE_STATS["hits"] += 1
+        _RESPONSE_CACHE.move_to_end(cache_key)
+        return cached[2]
+    _CACHE_STATS["misses"] += 1
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _RESPONSE_CACHE[cache_key] = (etag, last_modified, response.text)
+        _RESPONSE_CACHE.move_to_end(cache_key)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX_ENTRIES:
+            _RESPONSE_CACHE.popitem(last=False)
+    else:
+        # The page can no longer be revalidated, so don't keep sending its outdated validators
+        _RESPONSE_CACHE.pop(cache_key, None)
+    return response.text
+
+
+def get_cache_stats() -> dict[str, int]:
+    """
+    Returns how many fetches were answered from the response cache since the script started.
+
+    Returns:
+        dict[str, int]: The number of "hits" (304 Not Modified, cached body reused), "misses"
+                        (full body downloaded) and "entries" (pages currently cached).
+    """
+    return {**_CACHE_STATS, "entries": len(_RESPONSE_CACHE)}
 
 
-def _livestream_scoreboards_soup(
+def _normalize_stat(value: Any) -> Any:
+    """
+    Normalizes a single box score cell by converting numeric strings to integers,
+    replacing empty strings with zeros, and substituting '*' with 1.
+
+    Args:
+        value (Any): The raw cell value.
+
+    Returns:
+        Any: The normalized value, or the value as-is if it isn't a numeric or placeholder string.
+    """
+    if isinstance(value, str):
+        if value.isdigit():
+            return int(value)
+        # Replace empty strings with zero
+        elif value == "":
+            return 0
+        # Replace '*' with 1
+        elif value == "*":
+            return 1
+        # Keep other strings as-is
+        return value
+    # Preserve non-string values as-is
+    return value
+
+
+def _livestream_scoreboards_tree(
     date: str, sports_code: str, division: int, conference_id: Optional[int] = None
-) -> BeautifulSoup:
+) -> HtmlElement:
     """Fetches and parses the NCAA livestream scoreboards page for a specific date and sport.
 
     Args:
@@ -149,7 +267,7 @@ def _livestream_scoreboards_soup(
         conference_id (int): The ID of the conference. Defaults to None.
 
     Returns:
-        BeautifulSoup: Parsed HTML content of the livestream scoreboards page.
+        HtmlElement: Parsed HTML content of the livestream scoreboards page.
     """
     params = {
         "utf8": "%E2%9C%93",
@@ -161,44 +279,85 @@ def _livestream_scoreboards_soup(
     }
     if conference_id is not None:
         params["conference_id"] = conference_id
-    response = _fetch_url(
+    text = _fetch_text(
         "https://stats.ncaa.org/contests/livestream_scoreboards",
         params=params,
     )
 
-    return BeautifulSoup(response.text, "lxml")
+    return lxml.html.fromstring(text)
+
+
+def _first(xpath: etree.XPath, element: HtmlElement) -> HtmlElement | None:
+    """Evaluates a compiled XPath against an HTML element and returns the first match.
+
+    Args:
+        xpath   (XPath): The compiled XPath expression to evaluate.
+        element (HtmlElement): The HTML element to evaluate the expression against.
+
+    Returns:
+        HtmlElement: The first matching element, or None if nothing matched.
+    """
+    matches = xpath(element)
+    return matches[0] if matches else None
 
 
-def _get_href_id(element: Tag, split_index: int) -> str | None:
+def _get_href_id(element: HtmlElement, split_index: int) -> str | None:
     """Extracts a specific part of the href attribute from an HTML element.
 
     Args:
-        element     (Tag): The HTML tag element to extract from.
+        element     (HtmlElement): The HTML element to extract from.
         split_index (int): The index to split the href by "/" and retrieve.
 
     Returns:
          str: The extracted part of the href attribute, or None if an href isn't found.
     """
-    return element.get("href", "").split("/")[split_index] if element else None
+    return element.get("href", "").split("/")[split_index] if element is not None else None
 
 
-def _get_text(element: Tag) -> str | None:
+def _get_text(element: HtmlElement) -> str | None:
     """Extracts and strips the text content from an HTML element.
 
     Args:
-        element (Tag): The HTML tag element to extract text from.
+        element (HtmlElement): The HTML element to extract text from.
 
     Returns:
         str: The stripped text content, or None if a bad element is given.
     """
-    return element.text.strip() if element else None
+    return element.text_content().strip() if element is not None else None
 
 
-def get_days_scoreboard(
+@contextmanager
+def _atomic_csv_file(path: str) -> Iterator[TextIO]:
+    """Opens a uniquely named temporary file, next to the given path, for writing a UTF-8 CSV.
+
+    The temporary file replaces the given path once the block exits without an error, so a failed
+    write never leaves a truncated CSV behind and concurrent writers never share a temporary file.
+
+    Args:
+        path (str): The path of the CSV file to write.
+
+    Yields:
+        TextIO: The open temporary file.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        # mkstemp creates the file as owner-only, give it the permissions open() would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        with open(fd, "w", newline="", encoding="utf-8") as file:
+            yield file
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def iter_days_scoreboard(
     date: str, sports_code: str, division: int, conference_id: Optional[int] = None
-) -> pd.DataFrame:
+) -> Iterator[dict[str, Any]]:
     """
-    Retrieves the scoreboard data for games on a specified date.
+    Yields the scoreboard data for each game on a specified date.
 
     Args:
         date          (str): The date of the games in 'mm/dd/yyyy' format.
@@ -206,32 +365,31 @@ def get_days_scoreboard(
         division      (int): NCAA division number (e.g., 1, 2, or 3).
         conference_id (int): NCCA conference number (e.g. 30022, 14825 or 834)
 
-    Returns:
-        pd.DataFrame: DataFrame containing the scoreboard data for the specified date.
+    Yields:
+        dict[str, Any]: The scoreboard data of a single game, keyed by the names in
+                        _SCOREBOARD_FIELDS.
     """
-    soup = _livestream_scoreboards_soup(date, sports_code, division, conference_id)
-    data_array = []
+    tree = _livestream_scoreboards_tree(date, sports_code, division, conference_id)
 
     # Process each game table
-    for table in soup.find_all("table"):
+    for table in _XP_TABLES(tree):
         # Extract metadata for each gam
-        box_info = table.find(
-            "a", target=lambda x: x and x.startswith("box_score_"), class_="skipMask"
-        )
-        live_box_info = table.find("a", target="LIVE_BOX_SCORE", class_="skipMask")
-        if live_box_info:
+        box_info = _first(_XP_BOX_SCORE_LINK, table)
+        live_box_info = _first(_XP_LIVE_BOX_SCORE_LINK, table)
+        if live_box_info is not None:
             box_info = live_box_info
-        time_info = table.find("div", class_="col-6 p-0")
-        period_info = table.find("span", id=lambda x: x and x.startswith("period_"))
-        clock_info = table.find("span", id=lambda x: x and x.startswith("clock_"))
-        attendance_info = table.find("div", class_="col p-0 text-right")
+        time_info = _first(_XP_MATCH_TIME, table)
+        period_info = _first(_XP_PERIOD, table)
+        clock_info = _first(_XP_CLOCK, table)
+        attendance_info = _first(_XP_ATTENDANCE, table)
         attendance = None
-        if attendance_info and "Attend:" in attendance_info.text:
-            attendance = attendance_info.text.replace("Attend:", "").strip()
-        period_scores = table.find("table", id=lambda x: x and x.startswith("linescore_"))
-        if period_scores is None:
+        if attendance_info is not None and "Attend:" in attendance_info.text_content():
+            attendance = attendance_info.text_content().replace("Attend:", "").strip()
+        linescore = _first(_XP_LINESCORE, table)
+        if linescore is None:
             continue
-        period_scores = period_scores.find_all("td")
+        # Both teams' period scores live in the same line score table, so read it only once
+        period_scores = [td.text_content() for td in _XP_TDS(linescore)]
         data = {
             "game_id": _get_href_id(box_info, split_index=-2),
             "match_time": _get_text(time_info),
@@ -239,20 +397,18 @@ def get_days_scoreboard(
             "match_clock": _get_text(clock_info),
             "attendance": attendance,
         }
-        rows = table.find_all("tr", id=lambda x: x and x.startswith("contest_"))
+        rows = _XP_CONTEST_ROWS(table)
         # Extract team data
         for index, row in enumerate(rows):
             venue = "away" if index == 0 else "home"
-            team_img = row.find("img")
-            team_info = row.find("a", class_="skipMask")
-            period_scores = table.find("table", id=lambda x: x and x.startswith("linescore_"))
-            period_scores = period_scores.find_all("td")
-            final_score_info = row.find("div", id=lambda x: x and x.startswith("score_"))
+            team_img = _first(_XP_IMG, row)
+            team_info = _first(_XP_TEAM_LINK, row)
+            final_score_info = _first(_XP_FINAL_SCORE, row)
             # Period scores are stored in slices of the list: 0-3 for "away" and 4-7 for "home"
             start_index = index * 4  # 0 for away, 4 for home
             period_scores_dict = {
                 f"{venue}_period_{i+1}_score": (
-                    period_scores[start_index + i].text
+                    period_scores[start_index + i]
                     if start_index + i < len(period_scores)
                     else None
                 )
@@ -262,56 +418,151 @@ def get_days_scoreboard(
                 {
                     f"{venue}_name": _get_text(team_info),
                     f"{venue}_id": _get_href_id(team_info, split_index=-1),
-                    f"{venue}_logo_url": team_img.get("src") if team_img else None,
+                    f"{venue}_logo_url": team_img.get("src") if team_img is not None else None,
                     **period_scores_dict,
                     f"{venue}_final_score": _get_text(final_score_info),
                 }
             )
-        if data:
-            data_array.append(data)
-    return pd.DataFrame(data_array)
+        yield data
 
 
-def get_live_player_stats(game_id: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+def get_days_scoreboard(
+    date: str, sports_code: str, division: int, conference_id: Optional[int] = None
+) -> pd.DataFrame:
     """
-    Retrieves live player statistics from the give game ID.
+    Retrieves the scoreboard data for games on a specified date.
+
+    Args:
+        date          (str): The date of the games in 'mm/dd/yyyy' format.
+        sports_code   (str): The sport code (e.g., 'WBB' for women's basketball).
+        division      (int): NCAA division number (e.g., 1, 2, or 3).
+        conference_id (int): NCCA conference number (e.g. 30022, 14825 or 834)
+
+    Returns:
+        pd.DataFrame: DataFrame containing the scoreboard data for the specified date.
+    """
+    # Accumulate by column rather than by row so pandas doesn't have to introspect every game
+    columns = {field: [] for field in _SCOREBOARD_FIELDS}
+    for data in iter_days_scoreboard(date, sports_code, division, conference_id):
+        for field, column in columns.items():
+            column.append(data.get(field))
+    return pd.DataFrame(columns, copy=False)
+
+
+def stream_days_scoreboard_csv(
+    path: str,
+    date: str,
+    sports_code: str,
+    division: int,
+    conference_id: Optional[int] = None,
+) -> None:
+    """
+    Writes the scoreboard data for games on a specified date to a CSV file, one game at a time,
+    without building a DataFrame.
+
+    Args:
+        path          (str): The path of the CSV file to write.
+        date          (str): The date of the games in 'mm/dd/yyyy' format.
+        sports_code   (str): The sport code (e.g., 'WBB' for women's basketball).
+        division      (int): NCAA division number (e.g., 1, 2, or 3).
+        conference_id (int): NCCA conference number (e.g. 30022, 14825 or 834)
+    """
+    with _atomic_csv_file(path) as file:
+        writer = csv.DictWriter(file, fieldnames=_SCOREBOARD_FIELDS, lineterminator=os.linesep)
+        writer.writeheader()
+        writer.writerows(iter_days_scoreboard(date, sports_code, division, conference_id))
+
+
+def get_live_player_stats_raw(
+    game_id: int,
+) -> tuple[dict[str, list[Any]], dict[str, list[Any]]]:
+    """
+    Retrieves live player statistics from the give game ID without building DataFrames.
 
     Args:
         game_id (int): The unique identifier of the basketball game you want to retrieve stats for.
 
     Returns:
-        tuple: Returns a tuple of Dataframes where the first is the away team's stats and the
-               second is the home team's stats.
+        tuple: Returns a tuple of column dictionaries, mapping each stat header to its list of
+               values, where the first is the away team's stats and the second is the home team's
+               stats.
     """
-    response = _fetch_url(
+    text = _fetch_text(
         f"https://stats.ncaa.org/contests/livestream_scoreboards/{game_id}/box_score",
     )
-    soup = BeautifulSoup(response.text, "lxml")
-    for index, scoreboard in enumerate(soup.find_all("div", class_="col p-2")):
-        team_info = scoreboard.find("span", class_="d-none d-sm-block")
-        team_img = scoreboard.find("img")
-        player_data_table = scoreboard.find("table", id=lambda x: x and x.startswith("competitor_"))
-        table_headers = [th.text.strip() for th in player_data_table.find_all("th")]
-        team_data = []
-        for player in player_data_table.find_all("tr"):
+    tree = lxml.html.fromstring(text)
+    for index, scoreboard in enumerate(_XP_BOX_SCORE_TEAMS(tree)):
+        team_info = _first(_XP_TEAM_NAME, scoreboard)
+        team_img = _first(_XP_IMG, scoreboard)
+        player_data_table = _first(_XP_COMPETITOR_TABLE, scoreboard)
+        table_headers = [th.text_content().strip() for th in _XP_THS(player_data_table)]
+        # Accumulate by column rather than by row so pandas doesn't have to introspect every player
+        team_data = {header: [] for header in (*table_headers, "team_name", "team_logo_url")}
+        team_values = [
+            _get_text(team_info),
+            team_img.get("src") if team_img is not None else None,
+        ]
+        # Resolve the cell index of every stat column once per table instead of zipping each row
+        # into a dict. A repeated header keeps its last cell, just like the dict did.
+        cell_indexes = {header: cell_index for cell_index, header in enumerate(table_headers)}
+        cell_indexes.pop("team_name", None)
+        cell_indexes.pop("team_logo_url", None)
+        columns = [team_data[header] for header in (*cell_indexes, "team_name", "team_logo_url")]
+        for player in _XP_TRS(player_data_table):
             aggregate_column = False
-            player_data = [td.text.strip() for td in player.find_all("td")]
+            player_data = [td.text_content().strip() for td in _XP_TDS(player)]
             if len(player_data) > 0:
                 if len(player_data) < len(table_headers):
                     aggregate_column = True
                     player_data[1:1] = [None] * 4
-                player_data = _normalize_player_stats(dict(zip(table_headers, player_data)))
-                player_data["team_name"] = team_info.text.strip() if team_info else None
-                player_data["team_logo_url"] = team_img.get("src") if team_img else None
-                if aggregate_column:
-                    team_data.insert(0, player_data)
-                else:
-                    team_data.append(player_data)
+                values = [
+                    (
+                        _normalize_stat(player_data[cell_index])
+                        if cell_index < len(player_data)
+                        else None
+                    )
+                    for cell_index in cell_indexes.values()
+                ]
+                values.extend(team_values)
+                for column, value in zip(columns, values):
+                    if aggregate_column:
+                        column.insert(0, value)
+                    else:
+                        column.append(value)
         if index == 0:
-            away_data_array = team_data
+            away_data = team_data
         else:
-            home_data_array = team_data
-    return pd.DataFrame(away_data_array), pd.DataFrame(home_data_array)
+            home_data = team_data
+    return away_data, home_data
+
+
+def get_live_player_stats(game_id: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Retrieves live player statistics from the give game ID.
+
+    Args:
+        game_id (int): The unique identifier of the basketball game you want to retrieve stats for.
+
+    Returns:
+        tuple: Returns a tuple of Dataframes where the first is the away team's stats and the
+               second is the home team's stats.
+    """
+    away_data, home_data = get_live_player_stats_raw(game_id)
+    return pd.DataFrame(away_data, copy=False), pd.DataFrame(home_data, copy=False)
+
+
+def _write_columns_csv(path: str, columns: dict[str, list[Any]]) -> None:
+    """
+    Writes a dictionary of equal length columns to a CSV file with a header row.
+
+    Args:
+        path    (str): The path of the CSV file to write.
+        columns (dict[str, list[Any]]): The column values keyed by their header.
+    """
+    with _atomic_csv_file(path) as file:
+        writer = csv.writer(file, lineterminator=os.linesep)
+        writer.writerow(columns.keys())
+        writer.writerows(zip(*columns.values()))
 
 
 def main() -> None:
@@ -374,13 +625,12 @@ def main() -> None:
     conferences = {}
     conferences_filename = f"{args.sports_code}_d{args.division}_conf_ids.json"
     if not os.path.exists(conferences_filename) and args.list_games_by_date:
-        soup = _livestream_scoreboards_soup(
+        tree = _livestream_scoreboards_tree(
             date=args.list_games_by_date, sports_code=args.sports_code, division=args.division
         )
-        options = soup.find("select", id="conference_id_select", class_="chosen-select")
         conferences = {
-            option.text.strip(): int(option.get("value"))
-            for option in options.find_all("option")
+            option.text_content().strip(): int(option.get("value"))
+            for option in _XP_CONFERENCE_OPTIONS(tree)
             if option.get("value")
         }
         with open(conferences_filename, "w") as file:
@@ -402,22 +652,23 @@ def main() -> None:
     while True:
         try:
             if args.list_games_by_date:
-                data = get_days_scoreboard(
+                # Default filename based on date
+                filename = f"{args.list_games_by_date.replace('/', '-')}.csv"
+                stream_days_scoreboard_csv(
+                    filename,
                     date=args.list_games_by_date,
                     sports_code=args.sports_code,
                     division=args.division,
                     conference_id=conferences.get(args.conference, None),
                 )
-                # Default filename based on date
-                filename = f"{args.list_games_by_date.replace('/', '-')}.csv"
-                data.to_csv(filename, index=False)
 
             # Handle the 'get-live-player-stats' option
             elif args.get_live_player_stats:
-                away_data, home_data = get_live_player_stats(game_id=args.get_live_player_stats)
-                filename = f"{args.get_live_player_stats}.csv"
-                away_data.to_csv("away.csv", index=False)
-                home_data.to_csv("home.csv", index=False)
+                away_data, home_data = get_live_player_stats_raw(
+                    game_id=args.get_live_player_stats
+                )
+                _write_columns_csv("away.csv", away_data)
+                _write_columns_csv("home.csv", home_data)
         except Exception as e:
             print(f"Error executing: {e}")
 